@@ -1,8 +1,9 @@
 """Application configuration settings."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -11,20 +12,32 @@ class AppConfig:
     Application configuration container.
 
     Attributes:
-        file_extensions: Mapping of file categories to their extensions
+        file_extensions: Mapping of file categories to their lowercase
+            extensions, stored as tuples
         log_file: Path to the log file
         max_duplicate_suffix: Maximum number for duplicate file renaming
     """
 
-    file_extensions: Dict[str, List[str]]
+    file_extensions: Dict[str, Sequence[str]]
     log_file: Path
     max_duplicate_suffix: int
 
+    def __post_init__(self) -> None:
+        """Normalize extensions to lowercase tuples so they cannot be mutated."""
+        file_extensions: Dict[str, Tuple[str, ...]] = {
+            category: tuple(ext.lower() for ext in extensions)
+            for category, extensions in self.file_extensions.items()
+        }
+        object.__setattr__(self, 'file_extensions', file_extensions)
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_default() -> 'AppConfig':
         """
         Get default application configuration.
 
+        The instance is built on the first call and shared afterwards.
+
         Returns:
             Default AppConfig instance
         """
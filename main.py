@@ -10,8 +10,18 @@ from utils.logger import LoggerService
 from utils.file_utils import FileOperations
 from services.file_organizer import FileOrganizer
 from services.data_cleaner import DataCleaner
+import numpy as np
 import pandas as pd
-import random
+
+SAMPLE_CSV_DTYPES = {
+    'employee_id': 'int64',
+    'name': 'object',
+    'age': 'float64',
+    'salary': 'float64',
+    'department': 'object',
+    'city': 'object',
+    'years_experience': 'float64',
+}
 
 
 def create_sample_files(test_dir: Path) -> None:
@@ -57,7 +67,8 @@ def create_sample_csv(csv_path: Path) -> None:
     Args:
         csv_path: Path where CSV should be created
     """
-    random.seed(42)
+    rng = np.random.default_rng(42)
+    row_count = 25
 
     departments = ['HR', 'IT', 'Sales', 'Marketing', 'Finance']
     cities = ['Istanbul', 'Ankara', 'Izmir', 'Bursa', 'Antalya']
@@ -67,44 +78,42 @@ def create_sample_csv(csv_path: Path) -> None:
         'Ibrahim Erdogan', 'Selin Kurt', 'Burak Ozkan', 'Deniz Acar', 'Emre Yildiz'
     ]
 
-    data_rows = []
-
-    for i in range(1, 26):
-        name = random.choice(names)
-        age = random.randint(23, 60) if random.random() > 0.25 else None
-        salary = random.randint(40000, 120000) if random.random() > 0.30 else None
-        department = random.choice(departments) if random.random() > 0.20 else None
-        city = random.choice(cities) if random.random() > 0.25 else None
-
-        if name and random.random() > 0.30:
-            if random.random() > 0.5:
-                name = f"  {name}  "
-            else:
-                name = f"{name} "
-
-        if department and random.random() > 0.40:
-            department = department.upper() if random.random() > 0.5 else department.lower()
-
-        if city and random.random() > 0.50:
-            city = f" {city} " if random.random() > 0.5 else city
-
-        data_rows.append({
-            'employee_id': i,
-            'name': name,
-            'age': age,
-            'salary': salary,
-            'department': department,
-            'city': city,
-            'years_experience': random.randint(0, 25) if random.random() > 0.35 else None
-        })
-
-    duplicate_rows = [data_rows[5].copy(), data_rows[10].copy(), data_rows[15].copy(),
-                      data_rows[18].copy(), data_rows[22].copy()]
-    data_rows.extend(duplicate_rows)
-
-    random.shuffle(data_rows)
-
-    df = pd.DataFrame(data_rows)
+    def sometimes(probability: float) -> np.ndarray:
+        return rng.random(row_count) < probability
+
+    name = pd.Series(rng.choice(names, size=row_count), dtype=object)
+    age = pd.Series(rng.integers(23, 61, size=row_count)).where(~sometimes(0.25))
+    salary = pd.Series(rng.integers(40000, 120001, size=row_count)).where(~sometimes(0.30))
+    department = pd.Series(rng.choice(departments, size=row_count), dtype=object).where(~sometimes(0.20))
+    city = pd.Series(rng.choice(cities, size=row_count), dtype=object).where(~sometimes(0.25))
+    years_experience = pd.Series(rng.integers(0, 26, size=row_count)).where(~sometimes(0.35))
+
+    padded = sometimes(0.70)
+    both_sides = padded & sometimes(0.5)
+    name[both_sides] = '  ' + name[both_sides] + '  '
+    name[padded & ~both_sides] = name[padded & ~both_sides] + ' '
+
+    recased = department.notna().to_numpy() & sometimes(0.60)
+    upper = recased & sometimes(0.5)
+    department[upper] = department[upper].str.upper()
+    department[recased & ~upper] = department[recased & ~upper].str.lower()
+
+    spaced = city.notna().to_numpy() & sometimes(0.25)
+    city[spaced] = ' ' + city[spaced] + ' '
+
+    df = pd.DataFrame({
+        'employee_id': np.arange(1, row_count + 1),
+        'name': name,
+        'age': age,
+        'salary': salary,
+        'department': department,
+        'city': city,
+        'years_experience': years_experience,
+    })
+
+    duplicate_rows = df.iloc[[5, 10, 15, 18, 22]]
+    df = pd.concat([df, duplicate_rows], ignore_index=True)
+    df = df.iloc[rng.permutation(len(df))]
 
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(csv_path, index=False)
@@ -155,7 +164,7 @@ def demonstrate_data_cleaning(logger: LoggerService) -> None:
     logger.info(f"Created sample CSV with data quality issues: {input_csv}")
 
     try:
-        df_dirty = pd.read_csv(input_csv)
+        df_dirty = pd.read_csv(input_csv, dtype=SAMPLE_CSV_DTYPES, engine='c')
         logger.info(f"Original data: {len(df_dirty)} rows, {len(df_dirty.columns)} columns")
         logger.info(f"Missing values: {df_dirty.isnull().sum().sum()}")
         logger.info(f"Duplicate rows: {df_dirty.duplicated().sum()}")
@@ -163,7 +172,7 @@ def demonstrate_data_cleaning(logger: LoggerService) -> None:
         pass
 
     cleaner = DataCleaner(logger)
-    stats = cleaner.clean_csv(input_csv, output_csv)
+    stats = cleaner.clean_csv(input_csv, output_csv, dtypes=SAMPLE_CSV_DTYPES)
 
     if stats:
         logger.info("Data cleaning completed successfully")
@@ -1,10 +1,23 @@
 """Data cleaning service for CSV files."""
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal, Optional, Set, Tuple
+import numpy as np
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
 from utils.logger import LoggerService
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pacsv = None
+    pq = None
+
+OutputFormat = Literal['csv', 'parquet']
+
 
 class DataCleaner:
     """
@@ -22,13 +35,25 @@ class DataCleaner:
         """
         self._logger = logger
 
-    def clean_csv(self, file_path: Path, output_path: Path) -> Dict[str, Any]:
+    def clean_csv(
+        self,
+        file_path: Path,
+        output_path: Path,
+        dtypes: Optional[Dict[str, str]] = None,
+        chunksize: Optional[int] = None,
+        output_format: OutputFormat = 'csv'
+    ) -> Dict[str, Any]:
         """
         Clean a CSV file and save the result.
 
         Args:
             file_path: Path to the input CSV file
-            output_path: Path for the cleaned output CSV file
+            output_path: Path for the cleaned output file
+            dtypes: Optional column-to-dtype mapping that skips type inference
+            chunksize: If given, stream the file in chunks of this many rows
+                instead of loading it into memory at once
+            output_format: 'csv', or 'parquet' to write a zstd-compressed
+                Parquet file next to output_path (requires pyarrow)
 
         Returns:
             Dictionary containing cleaning statistics
@@ -37,30 +62,25 @@ class DataCleaner:
             self._logger.error(f"CSV file does not exist: {file_path}")
             return {}
 
-        self._logger.info(f"Starting data cleaning: {file_path.name}")
-
-        try:
-            df = pd.read_csv(file_path)
-            initial_rows = len(df)
-            initial_cols = len(df.columns)
-
-            stats: Dict[str, Any] = {
-                'initial_rows': initial_rows,
-                'initial_columns': initial_cols,
-                'missing_values_found': int(df.isnull().sum().sum()),
-                'duplicate_rows_found': int(df.duplicated().sum())
-            }
+        if output_format not in ('csv', 'parquet'):
+            self._logger.error(f"Unsupported output format: {output_format}")
+            return {}
 
-            df_cleaned = self._remove_duplicates(df)
-            df_cleaned = self._handle_missing_values(df_cleaned)
-            df_cleaned = self._standardize_data_types(df_cleaned)
+        if output_format == 'parquet':
+            if pq is None:
+                self._logger.error("Parquet output requires the pyarrow package")
+                return {}
+            output_path = output_path.with_suffix('.parquet')
 
-            stats['final_rows'] = len(df_cleaned)
-            stats['final_columns'] = len(df_cleaned.columns)
-            stats['rows_removed'] = initial_rows - len(df_cleaned)
+        self._logger.info(f"Starting data cleaning: {file_path.name}")
 
+        try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            df_cleaned.to_csv(output_path, index=False)
+
+            if chunksize is None:
+                stats = self._clean_in_memory(file_path, output_path, dtypes, output_format)
+            else:
+                stats = self._clean_in_chunks(file_path, output_path, dtypes, chunksize, output_format)
 
             self._log_cleaning_stats(stats, file_path.name)
             self._logger.info(f"Cleaned data saved to: {output_path}")
@@ -71,25 +91,418 @@ class DataCleaner:
             self._logger.error(f"Error cleaning CSV {file_path.name}: {str(e)}")
             return {}
 
-    def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _clean_in_memory(
+        self,
+        file_path: Path,
+        output_path: Path,
+        dtypes: Optional[Dict[str, str]],
+        output_format: OutputFormat
+    ) -> Dict[str, Any]:
+        """
+        Clean a CSV file that fits in memory.
+
+        Args:
+            file_path: Path to the input CSV file
+            output_path: Path for the cleaned output file
+            dtypes: Optional column-to-dtype mapping
+            output_format: Output file format
+
+        Returns:
+            Dictionary containing cleaning statistics
+        """
+        df = self._categorize_low_cardinality(self._read_csv(file_path, dtypes))
+        initial_rows = len(df)
+        initial_cols = len(df.columns)
+
+        null_mask = df.isnull()
+        missing_count = int(null_mask.to_numpy().sum())
+        columns_with_missing = df.columns[null_mask.any()]
+        first_positions = self._first_row_positions(df)
+        duplicate_count = initial_rows - len(first_positions)
+
+        stats: Dict[str, Any] = {
+            'initial_rows': initial_rows,
+            'initial_columns': initial_cols,
+            'missing_values_found': missing_count,
+            'duplicate_rows_found': duplicate_count
+        }
+
+        df_cleaned = self._remove_duplicates(df, first_positions)
+        df_cleaned = self._handle_missing_values(df_cleaned, missing_count, columns_with_missing)
+        df_cleaned = self._standardize_data_types(df_cleaned)
+
+        stats['final_rows'] = len(df_cleaned)
+        stats['final_columns'] = len(df_cleaned.columns)
+        stats['rows_removed'] = initial_rows - len(df_cleaned)
+
+        if output_format == 'parquet':
+            df_cleaned.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        else:
+            df_cleaned.to_csv(output_path, index=False)
+
+        return stats
+
+    @staticmethod
+    def _read_csv(file_path: Path, dtypes: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """
+        Read a whole CSV file, using pyarrow's multithreaded parser when possible.
+
+        Arrow is only used when dtypes declares every column with a type
+        Arrow can represent, so it never infers a column type itself (it would
+        otherwise parse dates and timestamps that pandas keeps as text). It
+        uses pandas' default missing-value tokens, allows quoted newlines, and
+        casts the result to the declared dtypes. In all other cases, if Arrow
+        rejects the file, or without pyarrow, the pandas C parser is used,
+        matching the chunked path.
+
+        Args:
+            file_path: Path to the CSV file
+            dtypes: Optional column-to-dtype mapping
+
+        Returns:
+            Parsed DataFrame with NumPy-backed columns
+        """
+        if pacsv is None or not dtypes:
+            return pd.read_csv(file_path, dtype=dtypes, engine='c')
+
+        columns = pd.read_csv(file_path, nrows=0, engine='c').columns
+        if not set(columns) <= set(dtypes):
+            return pd.read_csv(file_path, dtype=dtypes, engine='c')
+
+        column_types: Dict[str, Any] = {}
+        for column in columns:
+            dtype = dtypes[column]
+            try:
+                if pd.api.types.is_string_dtype(dtype):
+                    column_types[column] = pa.string()
+                else:
+                    column_types[column] = pa.from_numpy_dtype(np.dtype(dtype))
+            except (TypeError, pa.ArrowNotImplementedError):
+                return pd.read_csv(file_path, dtype=dtypes, engine='c')
+
+        try:
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=column_types,
+                    null_values=sorted(STR_NA_VALUES),
+                    strings_can_be_null=True,
+                    timestamp_parsers=[]
+                )
+            )
+        except pa.ArrowInvalid:
+            return pd.read_csv(file_path, dtype=dtypes, engine='c')
+
+        return table.to_pandas().astype(dtypes)
+
+    @staticmethod
+    def _categorize_low_cardinality(df: pd.DataFrame, max_ratio: float = 0.5) -> pd.DataFrame:
+        """
+        Convert text columns with few distinct values to the category dtype in place.
+
+        Categorical columns are hashed and compared by their integer codes,
+        which makes deduplication and mode lookups cheaper. They are written
+        out as their plain values.
+
+        Args:
+            df: Input DataFrame
+            max_ratio: Largest distinct-to-row ratio for a column to be converted
+
+        Returns:
+            DataFrame with low-cardinality text columns as categoricals
+        """
+        row_count = len(df)
+        for column in df.select_dtypes(include=['object', 'string']).columns:
+            distinct_count = df[column].nunique()
+            if 0 < distinct_count < max_ratio * row_count:
+                df[column] = df[column].astype('category')
+        return df
+
+    def _clean_in_chunks(
+        self,
+        file_path: Path,
+        output_path: Path,
+        dtypes: Optional[Dict[str, str]],
+        chunksize: int,
+        output_format: OutputFormat
+    ) -> Dict[str, Any]:
+        """
+        Clean a CSV file in two streaming passes over fixed-size chunks.
+
+        A light scan pass first fixes one dtype per column and finds the
+        columns with missing values. The first cleaning pass then counts
+        duplicates and missing values and collects exact file-wide medians and
+        modes from value counts; the second fills, strips and appends each
+        chunk to the output.
+
+        Rows are never held beyond one chunk. What remains is one value count
+        per distinct value of the columns that need filling, and one 8-byte
+        hash per unique row for cross-chunk deduplication, so memory grows
+        with distinct values and unique rows rather than with chunk size.
+        Duplicates across chunks are detected by 64-bit row hash alone.
+
+        Args:
+            file_path: Path to the input CSV file
+            output_path: Path for the cleaned output file
+            dtypes: Optional column-to-dtype mapping
+            chunksize: Number of rows per chunk
+            output_format: Output file format
+
+        Returns:
+            Dictionary containing cleaning statistics
+        """
+        dtypes, columns_with_missing = self._scan_chunked_columns(file_path, dtypes, chunksize)
+        numeric_columns = {
+            column for column in columns_with_missing
+            if pd.api.types.is_numeric_dtype(dtypes[column])
+            and not pd.api.types.is_bool_dtype(dtypes[column])
+        }
+
+        initial_rows = 0
+        initial_cols = 0
+        missing_count = 0
+        duplicate_count = 0
+        value_counts: Dict[str, pd.Series] = {}
+        seen_hashes = np.empty(0, dtype=np.uint64)
+
+        with pd.read_csv(file_path, dtype=dtypes, engine='c', chunksize=chunksize) as reader:
+            for chunk in reader:
+                initial_rows += len(chunk)
+                initial_cols = len(chunk.columns)
+
+                missing_count += int(chunk.isnull().to_numpy().sum())
+
+                keep, seen_hashes = self._first_occurrences(chunk, seen_hashes)
+                duplicate_count += int(len(chunk) - keep.sum())
+                unique_rows = chunk[keep]
+
+                for column in columns_with_missing:
+                    counts = unique_rows[column].value_counts()
+                    if column in value_counts:
+                        counts = value_counts[column].add(counts, fill_value=0)
+                    value_counts[column] = counts
+
+        if duplicate_count > 0:
+            self._logger.info(f"Removing {duplicate_count} duplicate rows")
+        if missing_count > 0:
+            self._logger.info(f"Handling {missing_count} missing values")
+
+        fill_values: Dict[str, Any] = {}
+        for column in columns_with_missing:
+            counts = value_counts.get(column, pd.Series(dtype=float))
+            if column in numeric_columns:
+                fill_values[column] = self._median_from_counts(counts)
+            else:
+                fill_values[column] = counts.sort_index().idxmax() if len(counts) > 0 else 'Unknown'
+
+        final_rows = 0
+        final_cols = initial_cols
+        seen_hashes = np.empty(0, dtype=np.uint64)
+        parquet_writer = None
+
+        try:
+            with pd.read_csv(file_path, dtype=dtypes, engine='c', chunksize=chunksize) as reader:
+                for chunk_number, chunk in enumerate(reader):
+                    keep, seen_hashes = self._first_occurrences(chunk, seen_hashes)
+                    chunk_cleaned = chunk[keep].fillna(fill_values)
+                    chunk_cleaned = self._standardize_data_types(chunk_cleaned)
+
+                    if output_format == 'parquet':
+                        schema = parquet_writer.schema if parquet_writer else None
+                        table = pa.Table.from_pandas(chunk_cleaned, schema=schema, preserve_index=False)
+                        if parquet_writer is None:
+                            parquet_writer = pq.ParquetWriter(output_path, table.schema, compression='zstd')
+                        parquet_writer.write_table(table)
+                    else:
+                        first_chunk = chunk_number == 0
+                        chunk_cleaned.to_csv(
+                            output_path,
+                            index=False,
+                            mode='w' if first_chunk else 'a',
+                            header=first_chunk
+                        )
+                    final_rows += len(chunk_cleaned)
+                    final_cols = len(chunk_cleaned.columns)
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+
+        return {
+            'initial_rows': initial_rows,
+            'initial_columns': initial_cols,
+            'missing_values_found': missing_count,
+            'duplicate_rows_found': duplicate_count,
+            'final_rows': final_rows,
+            'final_columns': final_cols,
+            'rows_removed': initial_rows - final_rows
+        }
+
+    @staticmethod
+    def _scan_chunked_columns(
+        file_path: Path,
+        dtypes: Optional[Dict[str, str]],
+        chunksize: int
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Derive one dtype per column and find the columns with missing values.
+
+        Undeclared columns follow the rules the pandas parser applies to a
+        whole file: integer if every chunk parsed as integers, float if every
+        chunk parsed as numbers, bool if every chunk parsed as booleans, and
+        object otherwise. Declared dtypes are kept as given.
+
+        Args:
+            file_path: Path to the CSV file
+            dtypes: Optional column-to-dtype mapping declared by the caller
+            chunksize: Number of rows per chunk
+
+        Returns:
+            Column-to-dtype mapping covering every column, and the columns
+            that contain missing values
+        """
+        declared = dict(dtypes or {})
+        columns = pd.read_csv(file_path, nrows=0, engine='c').columns
+        undeclared = [column for column in columns if column not in declared]
+
+        kinds: Dict[str, Set[str]] = {column: set() for column in undeclared}
+        first_dtypes: Dict[str, str] = {}
+        has_missing: Set[str] = set()
+        with pd.read_csv(file_path, dtype=declared or None, engine='c', chunksize=chunksize) as reader:
+            for chunk in reader:
+                has_missing.update(chunk.columns[chunk.isnull().any()])
+                for column in undeclared:
+                    kinds[column].add(chunk[column].dtype.kind)
+                    first_dtypes.setdefault(column, str(chunk[column].dtype))
+
+        inferred: Dict[str, str] = {}
+        for column in undeclared:
+            column_kinds = kinds[column]
+            if len(column_kinds) == 1 and column_kinds <= {'i', 'u', 'b', 'f'}:
+                inferred[column] = first_dtypes[column]
+            elif column_kinds <= {'i', 'u', 'f'}:
+                inferred[column] = 'float64'
+            else:
+                inferred[column] = 'object'
+
+        columns_with_missing = [column for column in columns if column in has_missing]
+        return {**inferred, **declared}, columns_with_missing
+
+    @staticmethod
+    def _median_from_counts(counts: pd.Series) -> float:
+        """
+        Compute the exact median of the values summarized by a value count.
+
+        Args:
+            counts: Occurrence count per distinct non-null value
+
+        Returns:
+            Median value, or NaN if there are no values
+        """
+        if len(counts) == 0:
+            return np.nan
+
+        counts = counts.sort_index()
+        cumulative = counts.to_numpy().cumsum()
+        total = cumulative[-1]
+        values = counts.index.to_numpy(dtype=float)
+        lower = values[np.searchsorted(cumulative, (total - 1) // 2, side='right')]
+        upper = values[np.searchsorted(cumulative, total // 2, side='right')]
+        return (lower + upper) / 2
+
+    @staticmethod
+    def _first_occurrences(
+        chunk: pd.DataFrame,
+        seen_hashes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mark rows whose content has not been seen in this or earlier chunks.
+
+        Args:
+            chunk: DataFrame chunk to check
+            seen_hashes: Sorted array of the row hashes seen so far
+
+        Returns:
+            Boolean mask that is True for the first occurrence of each row,
+            and the sorted hashes seen including this chunk
+        """
+        row_hashes = DataCleaner._row_hashes(chunk)
+        keep = ~pd.Series(row_hashes).duplicated().to_numpy()
+
+        if len(seen_hashes) > 0:
+            positions = np.searchsorted(seen_hashes, row_hashes)
+            seen_before = seen_hashes[np.minimum(positions, len(seen_hashes) - 1)] == row_hashes
+            keep &= ~seen_before
+
+        return keep, np.union1d(seen_hashes, row_hashes[keep])
+
+    @staticmethod
+    def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+        """
+        Hash each row's values, ignoring the index.
+
+        Float columns are normalized first so that -0.0 and 0.0, and all NaN
+        bit patterns, hash alike, as they compare equal in DataFrame.duplicated.
+
+        Args:
+            df: DataFrame to hash
+
+        Returns:
+            Array of 64-bit row hashes
+        """
+        float_columns = df.select_dtypes(include='floating').columns
+        if len(float_columns) > 0:
+            floats = df[float_columns] + 0.0
+            df = df.copy()
+            df[float_columns] = floats.mask(floats.isna())
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    @staticmethod
+    def _first_row_positions(df: pd.DataFrame) -> np.ndarray:
+        """
+        Find the position of the first occurrence of each distinct row.
+
+        Rows are hashed once; only rows that share a hash with another row are
+        compared value by value, so a hash collision never drops a distinct row.
+
+        Args:
+            df: DataFrame to check
+
+        Returns:
+            Sorted positions of the rows to keep
+        """
+        candidates = pd.Series(DataCleaner._row_hashes(df)).duplicated(keep=False).to_numpy()
+        is_duplicate = np.zeros(len(df), dtype=bool)
+        if candidates.any():
+            is_duplicate[candidates] = df[candidates].duplicated().to_numpy()
+        return np.flatnonzero(~is_duplicate)
+
+    def _remove_duplicates(self, df: pd.DataFrame, first_positions: np.ndarray) -> pd.DataFrame:
         """
         Remove duplicate rows from DataFrame.
 
         Args:
             df: Input DataFrame
+            first_positions: Sorted positions of the first occurrence of each row
 
         Returns:
             DataFrame with duplicates removed
         """
-        duplicates = df.duplicated().sum()
-        if duplicates > 0:
-            self._logger.info(f"Removing {duplicates} duplicate rows")
-            return df.drop_duplicates().copy()
-        return df.copy()
+        duplicate_count = len(df) - len(first_positions)
+        if duplicate_count > 0:
+            self._logger.info(f"Removing {duplicate_count} duplicate rows")
+            return df.take(first_positions)
+        return df
 
-    def _handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _handle_missing_values(
+        self,
+        df: pd.DataFrame,
+        missing_count: int,
+        columns_with_missing: pd.Index
+    ) -> pd.DataFrame:
         """
-        Handle missing values in DataFrame.
+        Handle missing values in DataFrame in place.
 
         Strategy:
         - Numeric columns: fill with median
@@ -97,35 +510,45 @@ class DataCleaner:
 
         Args:
             df: Input DataFrame
+            missing_count: Number of missing values already counted in df
+            columns_with_missing: Columns known to contain missing values
 
         Returns:
             DataFrame with missing values handled
         """
-        missing_count = df.isnull().sum().sum()
         if missing_count == 0:
             return df
 
         self._logger.info(f"Handling {missing_count} missing values")
 
-        df = df.copy()
+        numeric_columns = df[columns_with_missing].select_dtypes(include='number').columns
+        categorical_columns = columns_with_missing.difference(numeric_columns, sort=False)
 
-        for column in df.columns:
-            if df[column].isnull().any():
-                if pd.api.types.is_numeric_dtype(df[column]):
-                    median_value = df[column].median()
-                    df[column] = df[column].fillna(median_value)
-                    self._logger.debug(f"Filled numeric column '{column}' with median: {median_value}")
-                else:
-                    mode_values = df[column].mode()
-                    fill_value = mode_values[0] if len(mode_values) > 0 else 'Unknown'
-                    df[column] = df[column].fillna(fill_value)
-                    self._logger.debug(f"Filled categorical column '{column}' with: {fill_value}")
+        medians: Dict[str, Any] = {}
+        if len(numeric_columns) > 0:
+            medians = df[numeric_columns].median().to_dict()
+
+        modes: Dict[str, Any] = {}
+        if len(categorical_columns) > 0:
+            mode_frame = df[categorical_columns].mode()
+            if len(mode_frame) > 0:
+                first_modes = mode_frame.iloc[0]
+            else:
+                first_modes = pd.Series(index=categorical_columns, dtype=object)
+            modes = first_modes.fillna('Unknown').to_dict()
+
+        df.fillna({**medians, **modes}, inplace=True)
+
+        for column, median_value in medians.items():
+            self._logger.debug("Filled numeric column '%s' with median: %s", column, median_value)
+        for column, fill_value in modes.items():
+            self._logger.debug("Filled categorical column '%s' with: %s", column, fill_value)
 
         return df
 
     def _standardize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Standardize data types where possible.
+        Standardize data types where possible, modifying the DataFrame in place.
 
         Args:
             df: Input DataFrame
@@ -133,11 +556,9 @@ class DataCleaner:
         Returns:
             DataFrame with standardized types
         """
-        df = df.copy()
-
-        for column in df.columns:
-            if df[column].dtype == 'object':
-                df[column] = df[column].str.strip()
+        object_columns = df.select_dtypes(include=['object', 'string', 'category']).columns
+        if len(object_columns) > 0:
+            df[object_columns] = df[object_columns].apply(lambda column: column.str.strip())
 
         return df
 
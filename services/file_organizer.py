@@ -1,11 +1,16 @@
 """File organization service."""
 
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import DefaultDict, Dict, List, Set, Tuple
+import os
 from config.settings import AppConfig
 from utils.logger import LoggerService
 from utils.file_utils import FileOperations
 
+MAX_MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class FileOrganizer:
     """
@@ -25,25 +30,30 @@ class FileOrganizer:
         """
         self._config = config
         self._logger = logger
-        self._extension_map = self._build_extension_map()
+        self._lookup_category = self._build_extension_map().get
 
     def _build_extension_map(self) -> Dict[str, str]:
         """
         Build a reverse mapping from extension to category.
 
+        Extensions are already lowercase, as AppConfig normalizes them.
+
         Returns:
             Dictionary mapping extensions to category names
         """
         extension_map: Dict[str, str] = {}
         for category, extensions in self._config.file_extensions.items():
             for ext in extensions:
-                extension_map[ext.lower()] = category
+                extension_map[ext] = category
         return extension_map
 
     def organize_directory(self, directory: Path) -> Dict[str, int]:
         """
         Organize all files in a directory by their type.
 
+        Target names are chosen up front on the calling thread; the moves
+        themselves run concurrently on a thread pool.
+
         Args:
             directory: Directory to organize
 
@@ -57,34 +67,49 @@ class FileOrganizer:
         self._logger.info(f"Starting file organization in: {directory}")
 
         files = FileOperations.get_files_in_directory(directory, recursive=False)
-        stats: Dict[str, int] = {}
-        processed_files: Set[Path] = set()
+        stats: Counter[str] = Counter()
+        files_by_category: DefaultDict[str, List[Path]] = defaultdict(list)
 
         for file_path in files:
-            if file_path in processed_files:
-                continue
-
             category = self._get_file_category(file_path)
 
             if category == 'other':
-                self._logger.debug(f"Skipping uncategorized file: {file_path.name}")
+                self._logger.debug("Skipping uncategorized file: %s", file_path.name)
                 continue
 
+            files_by_category[category].append(file_path)
+
+        moves: List[Tuple[str, Path, Path]] = []
+
+        for category, category_files in files_by_category.items():
             target_dir = directory / category
-            FileOperations.ensure_directory(target_dir)
-
-            target_path = FileOperations.get_unique_filename(
-                target_dir,
-                file_path.name,
-                self._config.max_duplicate_suffix
-            )
-
-            if FileOperations.move_file(file_path, target_path):
-                stats[category] = stats.get(category, 0) + 1
-                processed_files.add(file_path)
-                self._logger.info(f"Moved {file_path.name} -> {category}/{target_path.name}")
+            if FileOperations.ensure_directory(target_dir):
+                existing_names: Set[str] = set()
             else:
-                self._logger.error(f"Failed to move {file_path.name}")
+                existing_names = FileOperations.get_entry_names(target_dir)
+
+            for file_path in category_files:
+                target_path = FileOperations.get_unique_filename(
+                    target_dir,
+                    file_path.name,
+                    self._config.max_duplicate_suffix,
+                    existing_names
+                )
+                moves.append((category, file_path, target_path))
+
+        if moves:
+            with ThreadPoolExecutor(max_workers=min(MAX_MOVE_WORKERS, len(moves))) as executor:
+                results = executor.map(
+                    lambda move: FileOperations.move_file(move[1], move[2]),
+                    moves
+                )
+
+                for (category, file_path, target_path), moved in zip(moves, results):
+                    if moved:
+                        stats[category] += 1
+                        self._logger.info(f"Moved {file_path.name} -> {category}/{target_path.name}")
+                    else:
+                        self._logger.error(f"Failed to move {file_path.name}")
 
         self._log_statistics(stats)
         return stats
@@ -99,8 +124,7 @@ class FileOrganizer:
         Returns:
             Category name or 'other' if not recognized
         """
-        extension = file_path.suffix.lower()
-        return self._extension_map.get(extension, 'other')
+        return self._lookup_category(file_path.suffix.lower(), 'other')
 
     def _log_statistics(self, stats: Dict[str, int]) -> None:
         """
@@ -0,0 +1,167 @@
+"""Tests for the CSV data cleaning service."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from services.data_cleaner import DataCleaner
+from utils.logger import LoggerService
+
+
+class DataCleanerTest(unittest.TestCase):
+    """Regression tests for DataCleaner.clean_csv."""
+
+    def setUp(self) -> None:
+        """Create a scratch directory and a cleaner."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        self.cleaner = DataCleaner(LoggerService())
+
+    def tearDown(self) -> None:
+        """Remove the scratch directory."""
+        self._tmp.cleanup()
+
+    def _write_input(self, text: str) -> Path:
+        """Write CSV text to the scratch directory and return its path."""
+        path = self.tmp_dir / 'input.csv'
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def test_date_and_empty_columns_are_kept_as_text(self) -> None:
+        """Undeclared date and all-empty columns are not reinterpreted."""
+        input_path = self._write_input(
+            'day,stamp,label,empty,amount\n'
+            '2024-01-01,2024-01-01 10:00, a ,,1\n'
+            '2024-01-02,2024-01-02 11:00,b,,\n'
+            '2024-01-02,2024-01-02 11:00,b,,\n'
+            '2024-01-03,2024-01-03 12:00,c,,3\n'
+        )
+        in_memory_path = self.tmp_dir / 'in_memory.csv'
+        chunked_path = self.tmp_dir / 'chunked.csv'
+
+        stats = self.cleaner.clean_csv(input_path, in_memory_path)
+        chunked_stats = self.cleaner.clean_csv(input_path, chunked_path, chunksize=2)
+
+        self.assertEqual(stats['final_rows'], 3)
+        self.assertEqual(stats['duplicate_rows_found'], 1)
+        self.assertEqual(stats, chunked_stats)
+        self.assertEqual(
+            in_memory_path.read_text(encoding='utf-8').splitlines(),
+            [
+                'day,stamp,label,empty,amount',
+                '2024-01-01,2024-01-01 10:00,a,,1.0',
+                '2024-01-02,2024-01-02 11:00,b,,2.0',
+                '2024-01-03,2024-01-03 12:00,c,,3.0',
+            ]
+        )
+        self.assertEqual(
+            chunked_path.read_text(encoding='utf-8'),
+            in_memory_path.read_text(encoding='utf-8')
+        )
+
+    def test_declared_dtypes_read_like_pandas(self) -> None:
+        """Fully declared input is read like the pandas parser reads it."""
+        dtypes = {'amount': 'float64', 'note': 'object'}
+        long_note = '"' + 'line\n' * 600 + '"'
+        input_path = self._write_input(
+            'amount,note\n'
+            '1.5,None\n'
+            'None,x\n'
+            '<NA>,x\n'
+            + ''.join(f'{i},{long_note}\n' for i in range(3000))
+        )
+        self.assertGreater(input_path.stat().st_size, 8 << 20)
+        in_memory_path = self.tmp_dir / 'in_memory.csv'
+        chunked_path = self.tmp_dir / 'chunked.csv'
+
+        stats = self.cleaner.clean_csv(input_path, in_memory_path, dtypes=dtypes)
+        chunked_stats = self.cleaner.clean_csv(input_path, chunked_path, dtypes=dtypes, chunksize=1000)
+
+        self.assertTrue(stats)
+        self.assertEqual(stats['missing_values_found'], 3)
+        self.assertEqual(stats, chunked_stats)
+        self.assertEqual(
+            chunked_path.read_text(encoding='utf-8'),
+            in_memory_path.read_text(encoding='utf-8')
+        )
+
+        df = DataCleaner._read_csv(input_path, {'amount': 'float64', 'note': 'string'})
+        self.assertEqual(df['note'].dtype, pd.StringDtype())
+
+    def test_duplicates_match_dataframe_duplicated(self) -> None:
+        """Signed zeros and missing values count as equal, as in duplicated()."""
+        input_path = self._write_input('a,b\n0.0,x\n-0.0,x\n,y\n,y\n')
+
+        stats = self.cleaner.clean_csv(input_path, self.tmp_dir / 'output.csv')
+
+        self.assertEqual(stats['duplicate_rows_found'], int(pd.read_csv(input_path).duplicated().sum()))
+        self.assertEqual(stats['duplicate_rows_found'], 2)
+        self.assertEqual(stats['final_rows'], 2)
+
+    def test_hash_collision_keeps_distinct_rows(self) -> None:
+        """Rows that only share a hash are not treated as duplicates."""
+        input_path = self._write_input('a,b\n1,x\n2,y\n1,x\n')
+        constant_hash = staticmethod(lambda df: np.zeros(len(df), dtype='uint64'))
+
+        with mock.patch.object(DataCleaner, '_row_hashes', constant_hash):
+            stats = self.cleaner.clean_csv(input_path, self.tmp_dir / 'output.csv')
+
+        self.assertEqual(stats['duplicate_rows_found'], 1)
+        self.assertEqual(stats['final_rows'], 2)
+
+    def test_chunked_column_types_hold_across_chunks(self) -> None:
+        """A column that is empty in the first chunk and text later is cleaned as text."""
+        input_path = self._write_input(
+            'id,note,score\n'
+            '1,,10\n'
+            '2,,\n'
+            '3,late,30\n'
+            '4,late,40\n'
+            '5,,50\n'
+        )
+        in_memory_path = self.tmp_dir / 'in_memory.csv'
+        chunked_path = self.tmp_dir / 'chunked.csv'
+
+        stats = self.cleaner.clean_csv(input_path, in_memory_path)
+        chunked_stats = self.cleaner.clean_csv(input_path, chunked_path, chunksize=2)
+
+        self.assertTrue(chunked_stats)
+        self.assertEqual(stats, chunked_stats)
+        self.assertEqual(
+            chunked_path.read_text(encoding='utf-8'),
+            in_memory_path.read_text(encoding='utf-8')
+        )
+        self.assertIn('1,late,10.0', chunked_path.read_text(encoding='utf-8'))
+
+    def test_chunked_medians_and_duplicates_match_in_memory(self) -> None:
+        """Medians from value counts and cross-chunk duplicates match the in-memory path."""
+        input_path = self._write_input(
+            'id,score,team\n'
+            '1,7,a\n'
+            '2,,b\n'
+            '3,1,a\n'
+            '1,7,a\n'
+            '4,4,\n'
+            '6,10,b\n'
+        )
+        in_memory_path = self.tmp_dir / 'in_memory.csv'
+        chunked_path = self.tmp_dir / 'chunked.csv'
+
+        stats = self.cleaner.clean_csv(input_path, in_memory_path)
+        chunked_stats = self.cleaner.clean_csv(input_path, chunked_path, chunksize=2)
+
+        self.assertEqual(stats['duplicate_rows_found'], 1)
+        self.assertEqual(stats, chunked_stats)
+        self.assertEqual(
+            chunked_path.read_text(encoding='utf-8'),
+            in_memory_path.read_text(encoding='utf-8')
+        )
+        self.assertIn('2,5.5,b', chunked_path.read_text(encoding='utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for the file operation utilities."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.file_utils import FileOperations
+
+
+class FileOperationsTest(unittest.TestCase):
+    """Regression tests for FileOperations."""
+
+    def setUp(self) -> None:
+        """Create a scratch directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        """Remove the scratch directory."""
+        self._tmp.cleanup()
+
+    def test_unique_filename_ignores_case_of_existing_names(self) -> None:
+        """A name differing only in case from an existing entry gets a suffix."""
+        (self.tmp_dir / 'Report.pdf').write_text('existing')
+        (self.tmp_dir / 'REPORT_1.PDF').write_text('existing')
+        existing_names = FileOperations.get_entry_names(self.tmp_dir)
+
+        first = FileOperations.get_unique_filename(self.tmp_dir, 'report.pdf', 10, existing_names)
+        second = FileOperations.get_unique_filename(self.tmp_dir, 'REPORT.pdf', 10, existing_names)
+
+        self.assertEqual(first, self.tmp_dir / 'report_2.pdf')
+        self.assertEqual(second, self.tmp_dir / 'REPORT_3.pdf')
+
+    def test_recursive_listing_skips_unreadable_subdirectories(self) -> None:
+        """A subdirectory that cannot be opened is skipped, not raised."""
+        (self.tmp_dir / 'top.txt').write_text('top')
+        locked = self.tmp_dir / 'locked'
+        locked.mkdir()
+        (locked / 'hidden.txt').write_text('hidden')
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if Path(path) == locked:
+                raise PermissionError(13, 'Permission denied', str(path))
+            return real_scandir(path)
+
+        with mock.patch('utils.file_utils.os.scandir', side_effect=scandir):
+            files = FileOperations.get_files_in_directory(self.tmp_dir, recursive=True)
+
+        self.assertEqual(files, [self.tmp_dir / 'top.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
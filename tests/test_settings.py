@@ -0,0 +1,33 @@
+"""Tests for the application configuration."""
+
+import dataclasses
+import pickle
+import unittest
+
+from config.settings import AppConfig
+
+
+class AppConfigTest(unittest.TestCase):
+    """Regression tests for AppConfig."""
+
+    def test_shared_default_cannot_be_mutated(self) -> None:
+        """The cached default exposes immutable extension lists."""
+        config = AppConfig.get_default()
+
+        self.assertIs(config, AppConfig.get_default())
+        with self.assertRaises(AttributeError):
+            config.file_extensions['images'].append('.webp')
+        self.assertNotIn('.webp', AppConfig.get_default().file_extensions['images'])
+
+    def test_default_round_trips_through_pickle_and_asdict(self) -> None:
+        """The default config stays picklable and convertible with asdict."""
+        config = AppConfig.get_default()
+
+        self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+        as_dict = dataclasses.asdict(config)
+        self.assertEqual(as_dict['file_extensions'], config.file_extensions)
+        self.assertEqual(AppConfig(**as_dict), config)
+
+
+if __name__ == '__main__':
+    unittest.main()
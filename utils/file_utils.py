@@ -1,7 +1,9 @@
 """File operation utilities."""
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Set
+import errno
+import os
 import shutil
 
 
@@ -13,20 +15,34 @@ class FileOperations:
     """
 
     @staticmethod
-    def ensure_directory(path: Path) -> None:
+    def ensure_directory(path: Path) -> bool:
         """
         Ensure a directory exists, create if it doesn't.
 
         Args:
             path: Directory path to ensure
+
+        Returns:
+            True if the directory was created, False if it already existed
         """
-        path.mkdir(parents=True, exist_ok=True)
+        try:
+            path.mkdir(parents=True)
+            return True
+        except FileExistsError:
+            if not path.is_dir():
+                raise
+            return False
 
     @staticmethod
     def get_files_in_directory(directory: Path, recursive: bool = False) -> List[Path]:
         """
         Get all files in a directory.
 
+        Entries are read with os.scandir, whose cached entry type avoids a
+        stat call per regular file. Symbolic links to files are included;
+        symbolic links to directories and unreadable subdirectories are
+        not descended into.
+
         Args:
             directory: Directory to search
             recursive: Whether to search recursively
@@ -37,16 +53,56 @@ class FileOperations:
         if not directory.exists() or not directory.is_dir():
             return []
 
-        if recursive:
-            return [f for f in directory.rglob('*') if f.is_file()]
-        else:
-            return [f for f in directory.iterdir() if f.is_file()]
+        files: List[Path] = []
+        pending = [directory]
+
+        while pending:
+            current = pending.pop()
+            try:
+                entries = os.scandir(current)
+            except PermissionError:
+                if current == directory:
+                    raise
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_file():
+                        files.append(Path(entry.path))
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+
+        return files
+
+    @staticmethod
+    def get_entry_names(directory: Path) -> Set[str]:
+        """
+        Get the case-folded names of all entries in a directory with a single scan.
+
+        Names are case-folded so that collision checks against the set are
+        safe on case-insensitive file systems.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Set of case-folded entry names, empty if the directory does not exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name.casefold() for entry in entries}
+        except FileNotFoundError:
+            return set()
 
     @staticmethod
     def move_file(source: Path, destination: Path) -> bool:
         """
         Move a file from source to destination.
 
+        Uses a single atomic rename when both paths are on the same file
+        system and falls back to shutil.move otherwise. An existing
+        destination is overwritten, so callers should pick a unique name.
+
         Args:
             source: Source file path
             destination: Destination file path
@@ -54,6 +110,13 @@ class FileOperations:
         Returns:
             True if successful, False otherwise
         """
+        try:
+            os.replace(source, destination)
+            return True
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                return False
+
         try:
             shutil.move(str(source), str(destination))
             return True
@@ -61,10 +124,52 @@ class FileOperations:
             return False
 
     @staticmethod
-    def get_unique_filename(directory: Path, filename: str, max_suffix: int = 9999) -> Path:
+    def get_unique_filename(
+        directory: Path,
+        filename: str,
+        max_suffix: int = 9999,
+        existing_names: Optional[Set[str]] = None
+    ) -> Path:
         """
         Generate a unique filename by appending a numeric suffix if needed.
 
+        When existing_names is given, collisions are checked against that set
+        of case-folded names (see get_entry_names) instead of the file system,
+        and the chosen name is added to it.
+
+        Args:
+            directory: Target directory
+            filename: Original filename
+            max_suffix: Maximum suffix number to try
+            existing_names: Optional case-folded names already present in directory
+
+        Returns:
+            Unique file path
+        """
+        if existing_names is None:
+            return FileOperations._probe_unique_filename(directory, filename, max_suffix)
+
+        base_path = directory / filename
+        name = filename
+
+        if name.casefold() in existing_names:
+            stem = base_path.stem
+            suffix = base_path.suffix
+            name = f"{stem}_final{suffix}"
+            for i in range(1, max_suffix + 1):
+                candidate = f"{stem}_{i}{suffix}"
+                if candidate.casefold() not in existing_names:
+                    name = candidate
+                    break
+
+        existing_names.add(name.casefold())
+        return directory / name
+
+    @staticmethod
+    def _probe_unique_filename(directory: Path, filename: str, max_suffix: int) -> Path:
+        """
+        Generate a unique filename by checking the file system for each candidate.
+
         Args:
             directory: Target directory
             filename: Original filename
@@ -86,4 +191,4 @@ class FileOperations:
             if not new_path.exists():
                 return new_path
 
-        return directory / f"{stem}_final{suffix}"
\ No newline at end of file
+        return directory / f"{stem}_final{suffix}"
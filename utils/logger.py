@@ -1,8 +1,11 @@
 """Logging service with singleton pattern."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 class LoggerService:
@@ -14,6 +17,7 @@ class LoggerService:
 
     _instance: Optional['LoggerService'] = None
     _logger: Optional[logging.Logger] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
 
     def __new__(cls) -> 'LoggerService':
         """
@@ -32,7 +36,15 @@ class LoggerService:
             self._setup_logger()
 
     def _setup_logger(self) -> None:
-        """Configure the logger with file and console handlers."""
+        """
+        Configure the logger with file and console handlers.
+
+        Records are put on a queue and handled by a background listener
+        thread. The calling thread still merges the message arguments when
+        the record is enqueued; the handlers' formatting and the console and
+        file writes run on the listener thread. The listener is stopped,
+        flushing pending records, at interpreter exit.
+        """
         self._logger = logging.getLogger('FileAutomation')
         self._logger.setLevel(logging.INFO)
 
@@ -49,45 +61,58 @@ class LoggerService:
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
 
-        self._logger.addHandler(console_handler)
-        self._logger.addHandler(file_handler)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
-    def info(self, message: str) -> None:
+        self._listener = logging.handlers.QueueListener(
+            log_queue,
+            console_handler,
+            file_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
+    def info(self, message: str, *args: Any) -> None:
         """
         Log an info message.
 
         Args:
-            message: The message to log
+            message: The message to log, optionally with %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
         if self._logger:
-            self._logger.info(message)
+            self._logger.info(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """
         Log an error message.
 
         Args:
-            message: The error message to log
+            message: The error message to log, optionally with %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
         if self._logger:
-            self._logger.error(message)
+            self._logger.error(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """
         Log a warning message.
 
         Args:
-            message: The warning message to log
+            message: The warning message to log, optionally with %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
         if self._logger:
-            self._logger.warning(message)
+            self._logger.warning(message, *args)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any) -> None:
         """
         Log a debug message.
 
         Args:
-            message: The debug message to log
+            message: The debug message to log, optionally with %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
-        if self._logger:
-            self._logger.debug(message)
\ No newline at end of file
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(message, *args)
\ No newline at end of file